@@ -1,33 +1,20 @@
 import uuid
-import requests
+import secrets
 import json
+import orjson
 from typing import Dict, Tuple, Optional
+from config import get_session, get_async_client
 
-def calculate_nlp(post_id: int, cookies: Dict[str, str]) -> Tuple[int, Dict[str, str], str]:
-    """
-    Calculate NLP metrics for a draft post using the NewsBreak API.
-    
-    Args:
-        post_id (int): The draft post ID to calculate NLP metrics for
-        cookies (dict): Dictionary containing required cookies for authentication
-    
-    Returns:
-        tuple: (status_code, response_dict, request_id)
-            - status_code (int): HTTP status code
-            - response_dict (dict): Parsed JSON response with keys:
-                - code (int): 0 for success
-                - status (str): "success" for successful calculation
-                - message (str): Additional message if any
-            - request_id (str): Unique request identifier
-    """
-    url = "https://creators.newsbreak.com/api/nlp/calculate"
-    
+_NLP_URL = "https://creators.newsbreak.com/api/nlp/calculate"
+
+def _prepare_nlp_request(post_id: int) -> Tuple[dict, bytes, str]:
+    """Build the headers, serialized payload, and request ID for an NLP call."""
     # Generate a unique identifier for x-request-id
-    unique_request_id = str(uuid.uuid4())
-    
+    unique_request_id = uuid.uuid4().hex
+
     # Generate trace ID
-    trace_id = str(uuid.uuid4())
-    
+    trace_id = secrets.token_hex(16)
+
     headers = {
         "Accept": "application/json, text/plain, */*",
         "Accept-Language": "en-US,en;q=0.9,zh-CN;q=0.8,zh;q=0.7",
@@ -54,22 +41,60 @@ def calculate_nlp(post_id: int, cookies: Dict[str, str]) -> Tuple[int, Dict[str,
         "sentry-trace": f"{trace_id}-{unique_request_id[:16]}",
         "x-request-id": unique_request_id,
     }
-    
-    # Build the payload with the post_id
+
+    # Build the payload with the post_id; serialize with orjson
     payload = {
         "post_id": post_id
     }
-    
-    # Make the API request
-    response = requests.post(url, json=payload, headers=headers, cookies=cookies)
-    
-    # Parse the JSON response
+
+    return headers, orjson.dumps(payload), unique_request_id
+
+def _parse_nlp_response(content: bytes) -> Dict[str, str]:
+    """Parse the JSON response straight from the bytes (skips the text decode)."""
     try:
-        response_dict = json.loads(response.text)
-    except json.JSONDecodeError:
-        response_dict = {"code": -1, "status": "error", "message": "Failed to parse JSON response"}
-    
-    return response.status_code, response_dict, unique_request_id
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        return {"code": -1, "status": "error", "message": "Failed to parse JSON response"}
+
+def calculate_nlp(post_id: int, cookies: Dict[str, str]) -> Tuple[int, Dict[str, str], str]:
+    """
+    Calculate NLP metrics for a draft post using the NewsBreak API.
+
+    Args:
+        post_id (int): The draft post ID to calculate NLP metrics for
+        cookies (dict): Dictionary containing required cookies for authentication
+
+    Returns:
+        tuple: (status_code, response_dict, request_id)
+            - status_code (int): HTTP status code
+            - response_dict (dict): Parsed JSON response with keys:
+                - code (int): 0 for success
+                - status (str): "success" for successful calculation
+                - message (str): Additional message if any
+            - request_id (str): Unique request identifier
+    """
+    headers, body, unique_request_id = _prepare_nlp_request(post_id)
+
+    # Make the API request
+    response = get_session().post(_NLP_URL, data=body, headers=headers, cookies=cookies)
+
+    return response.status_code, _parse_nlp_response(response.content), unique_request_id
+
+async def calculate_nlp_async(post_id: int, cookies: Dict[str, str]) -> Tuple[int, Dict[str, str], str]:
+    """
+    Async variant of calculate_nlp using the shared httpx client, for running
+    NLP calculations concurrently with other in-flight API calls.
+
+    Returns:
+        tuple: (status_code, response_dict, request_id) as in calculate_nlp
+    """
+    headers, body, unique_request_id = _prepare_nlp_request(post_id)
+
+    response = await get_async_client().post(
+        _NLP_URL, content=body, headers=headers, cookies=cookies
+    )
+
+    return response.status_code, _parse_nlp_response(response.content), unique_request_id
 
 def main():
     """Example usage of the calculate_nlp function."""
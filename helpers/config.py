@@ -1,57 +1,121 @@
 import os
+import gzip
 from dotenv import load_dotenv
 import uuid
+import secrets
+import requests
+import httpx
+from urllib3.util import Retry
 
 # Load environment variables
 load_dotenv()
 
+# Shared session so sequential API calls (draft -> upload -> PUT -> publish)
+# reuse pooled keep-alive connections instead of paying a TLS handshake each.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    requests.adapters.HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+    ),
+)
+
+def get_session():
+    """Get the shared requests session with connection pooling."""
+    return _SESSION
+
+# Bodies smaller than this aren't worth gzip's fixed overhead.
+_GZIP_MIN_BYTES = 1024
+
+def send_json(method, url, body, headers, cookies, **kwargs):
+    """
+    Send a serialized JSON body on the shared session, gzip-compressing it
+    when large. The repetitive style block in draft/PUT payloads compresses
+    ~4-5x even at the fastest level, so the wire transfer shrinks accordingly.
+    """
+    headers = {**headers, "Content-Type": "application/json"}
+    if len(body) >= _GZIP_MIN_BYTES:
+        body = gzip.compress(body, compresslevel=1)
+        headers["Content-Encoding"] = "gzip"
+    return _SESSION.request(method, url, data=body, headers=headers, cookies=cookies, **kwargs)
+
+_ASYNC_CLIENT = None
+
+def get_async_client():
+    """
+    Get the shared httpx.AsyncClient, created lazily on first use. HTTP/2
+    multiplexes concurrent draft/upload/PUT calls over one connection.
+    """
+    global _ASYNC_CLIENT
+    if _ASYNC_CLIENT is None or _ASYNC_CLIENT.is_closed:
+        _ASYNC_CLIENT = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        )
+    return _ASYNC_CLIENT
+
+# Cookie values are fixed for the process lifetime; read the env once.
+_COOKIES = {
+    "__nbpix_uid": os.getenv("NBPIX_UID"),
+    "media_id": os.getenv("MEDIA_ID"),
+    "media_id.sig": os.getenv("MEDIA_ID_SIG"),
+    "mp_session": os.getenv("MP_SESSION"),
+    "mp_session.sig": os.getenv("MP_SESSION_SIG"),
+}
+
 def get_cookies():
     """Get cookies from environment variables."""
-    return {
-        "__nbpix_uid": os.getenv("NBPIX_UID"),
-        "media_id": os.getenv("MEDIA_ID"),
-        "media_id.sig": os.getenv("MEDIA_ID_SIG"),
-        "mp_session": os.getenv("MP_SESSION"),
-        "mp_session.sig": os.getenv("MP_SESSION_SIG"),
-    }
+    return _COOKIES.copy()
+
+# These header values come from the environment and never change during the
+# process lifetime, so build them once at import time instead of doing a
+# dozen os.getenv lookups per call.
+_STATIC_HEADERS = {
+    "Accept": os.getenv("ACCEPT"),
+    "Accept-Language": os.getenv("ACCEPT_LANGUAGE"),
+    "Connection": "keep-alive",
+    "Content-Type": os.getenv("CONTENT_TYPE"),
+    "Origin": os.getenv("ORIGIN"),
+    "Referer": f"{os.getenv('REFERER_BASE')}/new-editor",
+    "Sec-Fetch-Dest": "empty",
+    "Sec-Fetch-Mode": "cors",
+    "Sec-Fetch-Site": "same-origin",
+    "User-Agent": os.getenv("USER_AGENT"),
+    "sec-ch-ua": os.getenv("SEC_CH_UA"),
+    "sec-ch-ua-mobile": os.getenv("SEC_CH_UA_MOBILE"),
+    "sec-ch-ua-platform": os.getenv("SEC_CH_UA_PLATFORM"),
+}
+
+_BAGGAGE_PREFIX = (
+    f"sentry-environment={os.getenv('SENTRY_ENVIRONMENT')},"
+    f"sentry-public_key={os.getenv('SENTRY_PUBLIC_KEY')},"
+    "sentry-trace_id="
+)
 
 def get_common_headers(request_id=None, trace_id=None):
     """
     Get common headers from environment variables.
-    
+
     Args:
         request_id (str, optional): Custom request ID. If None, one will be generated.
         trace_id (str, optional): Custom trace ID. If None, one will be generated.
     """
     if not request_id:
-        request_id = str(uuid.uuid4())
+        request_id = uuid.uuid4().hex
     if not trace_id:
-        trace_id = str(uuid.uuid4()).replace('-', '')[:32]
-    span_id = str(uuid.uuid4()).replace('-', '')[:16]
-    
-    return {
-        "Accept": os.getenv("ACCEPT"),
-        "Accept-Language": os.getenv("ACCEPT_LANGUAGE"),
-        "Connection": "keep-alive",
-        "Content-Type": os.getenv("CONTENT_TYPE"),
-        "Origin": os.getenv("ORIGIN"),
-        "Referer": f"{os.getenv('REFERER_BASE')}/new-editor",
-        "Sec-Fetch-Dest": "empty",
-        "Sec-Fetch-Mode": "cors",
-        "Sec-Fetch-Site": "same-origin",
-        "User-Agent": os.getenv("USER_AGENT"),
-        "baggage": (
-            f"sentry-environment={os.getenv('SENTRY_ENVIRONMENT')},"
-            f"sentry-public_key={os.getenv('SENTRY_PUBLIC_KEY')},"
-            f"sentry-trace_id={trace_id}"
-        ),
-        "sec-ch-ua": os.getenv("SEC_CH_UA"),
-        "sec-ch-ua-mobile": os.getenv("SEC_CH_UA_MOBILE"),
-        "sec-ch-ua-platform": os.getenv("SEC_CH_UA_PLATFORM"),
-        "sentry-trace": f"{trace_id}-{span_id}",
-        "x-request-id": request_id,
-    }
+        trace_id = secrets.token_hex(16)
+    span_id = secrets.token_hex(8)
+
+    headers = _STATIC_HEADERS.copy()
+    headers["baggage"] = _BAGGAGE_PREFIX + trace_id
+    headers["sentry-trace"] = f"{trace_id}-{span_id}"
+    headers["x-request-id"] = request_id
+    return headers
+
+_API_BASE_URL = f"{os.getenv('ORIGIN')}/api"
 
 def get_api_base_url():
     """Get base API URL."""
-    return f"{os.getenv('ORIGIN')}/api" 
\ No newline at end of file
+    return _API_BASE_URL
@@ -0,0 +1,155 @@
+import json
+import urllib.parse
+
+# urllib.parse.quote runs a Python-level loop per character; the image metadata
+# JSON is ASCII, so a precomputed str.translate table does the same
+# percent-encoding in a single C pass. Safe set matches quote(safe='/').
+_QUOTE_TABLE = {
+    i: "%{:02X}".format(i)
+    for i in range(128)
+    if chr(i) not in (
+        "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.-~/"
+    )
+}
+
+def _quote_ascii(text):
+    """Percent-encode a string; equivalent to urllib.parse.quote."""
+    if not text.isascii():
+        return urllib.parse.quote(text)
+    return text.translate(_QUOTE_TABLE)
+
+# The editornodeinfo JSON only varies in imageUrl, creditText, and the two
+# dimensions; percent-encode the constant chunks once at import time so each
+# call quotes just the variable parts.
+_INFO_HEAD_Q = _quote_ascii('{"type":"editor-image-node","imageUrl":"')
+_INFO_MID1_Q = _quote_ascii('","imageCaption":"","creditText":"')
+_INFO_MID2_Q = _quote_ascii(
+    '","creditUrl":"","imagePlatform":"SELF_UPLOAD","imageOriginalWidth":'
+)
+_INFO_MID3_Q = _quote_ascii(',"imageOriginalHeight":')
+_INFO_TAIL_Q = _quote_ascii('}')
+
+# The C-level encoder escapes any non-ASCII to \uXXXX, so its output (minus
+# the surrounding quotes) always takes the translate fast path below.
+_json_escape = json.encoder.encode_basestring_ascii
+
+def _quote_json_str(value):
+    """JSON-escape a string value and percent-encode it for the attribute."""
+    return _json_escape(value)[1:-1].translate(_QUOTE_TABLE)
+
+# Single template for the figure markup; the C-level formatter fills every
+# field in one pass instead of concatenating 17 f-string fragments.
+_IMG_TEMPLATE = (
+    '<figure>'
+    '<div data-editornodeinfo="{info}">'
+    '<div class="editor-image-wrap">'
+    '<div class="editor-image">'
+    '<img class="" src="{url}" '
+    'data-image-caption="" '
+    'data-credit-text="{credit}" '
+    'data-credit-url="" '
+    'data-image-platform="SELF_UPLOAD" '
+    'data-image-original-width="{width}" '
+    'data-image-original-height="{height}">'
+    '</div>'
+    '<span class="image-introduction-wrap">'
+    '<span class="photo-by">Photo by</span>'
+    '<span class="credit-text">{credit}</span>'
+    '</span>'
+    '</div>'
+    '</div>'
+    '</figure>'
+)
+
+def create_image_block(image_url, credit_text, width=1500, height=1000):
+    """
+    Create the HTML block for the image using a data-editornodeinfo attribute
+    that contains URL-encoded JSON metadata.
+    """
+    info_str = "".join((
+        _INFO_HEAD_Q, _quote_json_str(image_url),
+        _INFO_MID1_Q, _quote_json_str(credit_text),
+        _INFO_MID2_Q, str(width),
+        _INFO_MID3_Q, str(height),
+        _INFO_TAIL_Q,
+    ))
+
+    return _IMG_TEMPLATE.format_map({
+        "info": info_str,
+        "url": image_url,
+        "credit": credit_text,
+        "width": width,
+        "height": height,
+    })
+
+# CSS style block appended to every article body; static, so built once at
+# import time instead of re-concatenating ~50 fragments per call.
+STYLE_BLOCK = (
+    '<style style="display: none">'
+    '.NBAIEditor_Theme__ol1 {padding: 0 0 0 20px !important;margin: 0 0 24px 0 !important;list-style-position: outside !important;}'
+    '.NBAIEditor_Theme__ol2 {padding: 0 !important;margin: 0 !important;list-style-type: lower-alpha !important;list-style-position: outside !important;}'
+    'html body.post #content-div .content ol li ol {margin: 0 !important;}'
+    '.NBAIEditor_Theme__ol3 {padding: 0 !important;margin: 0 !important;list-style-type: lower-roman !important;list-style-position: outside !important;}'
+    '.NBAIEditor_Theme__ol4 {padding: 0;margin: 0;list-style-type: upper-roman !important;list-style-position: outside !important;}'
+    '.NBAIEditor_Theme__ol5 {padding: 0;margin: 0;list-style-type: lower-roman !important;list-style-position: outside !important;}'
+    '.NBAIEditor_Theme__ul {padding: 0 !important;margin: 0 !important;margin-left: 20px !important;list-style-position: outside !important;}'
+    '@media all and (max-width: 600px) {.NBAIEditor_Theme__ul {margin-left: 14px !important;}}'
+    '.NBAIEditor_Theme__ul li .NBAIEditor_Theme__ul li .NBAIEditor_Theme__ul li::before {display: none !important;}'
+    '.NBAIEditor_Theme__ul .NBAIEditor_Theme__ul {list-style-type: circle !important;margin-left: 0 !important;}'
+    '.NBAIEditor_Theme__ul .NBAIEditor_Theme__ul .NBAIEditor_Theme__ul {list-style-type: square !important;margin-left: 0 !important;}'
+    'html body.post #content-div .content ul li ul li ul {margin-left: 0 !important;}'
+    '.ContentEditable__root > ul {margin-bottom: 24px;padding: 0 0 0 20px;}'
+    '.NBAIEditor_Theme__listItem {margin: 0 !important;padding: 0 !important;}'
+    '.NBAIEditor_Theme__nestedListItem {list-style-type: none !important;padding: 0 0 0 24px !important;}'
+    '.NBAIEditor_Theme__nestedListItem:before, .NBAIEditor_Theme__nestedListItem:after {display: none;}'
+    '.editor-image-wrap {display: flex;flex-direction: column;position: relative;margin: 24px auto 12px;}'
+    '.editor-image-wrap .editor-image {position: relative;z-index: 1;cursor: pointer;margin-top: 0;}'
+    '.editor-image-wrap .editor-image img {width: 100%;border-radius: 8px;margin-top: 0;}'
+    '.editor-image-wrap .image-introduction-wrap {font-size: 14px;line-height: 20px;color: rgba(0, 0, 0, 0.6);margin-top: 12px;user-select: none;}'
+    ':root[class~="dark"] .editor-image-wrap .image-introduction-wrap {color: inherit;}'
+    '.editor-image-wrap .image-introduction-wrap .image-caption {margin-right: 3px;}'
+    '.editor-image-wrap .image-introduction-wrap .photo-by {color: rgba(0, 0, 0, 0.3);}'
+    ':root[class~="dark"] .editor-image-wrap .image-introduction-wrap .photo-by {color: rgba(255, 255, 255, .6);}'
+    '.editor-image-wrap .image-introduction-wrap .credit-text {margin-left: 6px;}'
+    '.editor-image-wrap .image-introduction-wrap .credit-text a {color: rgba(0, 0, 0, 0.6);position: relative;text-decoration: underline;text-underline-offset: 5px;text-decoration-color: rgba(0, 0, 0, 0.3);}'
+    ':root[class~="dark"] .editor-image-wrap .image-introduction-wrap .credit-text a {color: rgb(47, 128, 237);text-decoration: none;}'
+    '.editor-image-wrap .image-introduction-wrap .text-on {font-size: 14px;line-height: 20px;color: rgba(0, 0, 0, 0.3);margin-left: 6px;}'
+    ':root[class~="dark"] .editor-image-wrap .image-introduction-wrap .text-on {color: rgba(255, 255, 255, .6);}'
+    '.editor-image-wrap .image-introduction-wrap .link-unsplash-official {position: relative;margin-left: 6px;color: rgba(0, 0, 0, 0.6);text-decoration: underline;text-underline-offset: 5px;text-decoration-color: rgba(0, 0, 0, 0.3);}'
+    ':root[class~="dark"] .editor-image-wrap .image-introduction-wrap .link-unsplash-official {color: rgb(47, 128, 237);text-decoration: none;}'
+    '.node-embed-wrap {display: flex;justify-content: center;}'
+    '.node-embed-wrap .node-embed {position: relative;width: 100%;box-sizing: content-box;}'
+    '.node-embed-wrap .node-embed .mask {position: absolute;left: 0;right: 0;top: 0;bottom: 0;background-color: #fff;opacity: 0.5;z-index: 1;}'
+    '.node-embed-wrap .node-embed .btn-edit-delete {position: absolute;top: 38px;right: 32px;cursor: pointer;z-index: 2;}'
+    '.node-embed-wrap .node-embed:hover {border: 2px solid rgba(36, 81, 255, 0.3);}'
+    '.node-embed-wrap .node-embed.selected {border: 2px solid rgba(36, 81, 255, 0.6);}'
+    '#node-article-wrap {display: flex;justify-content: center;align-items: center;border-radius: 11px;border: 1px solid #f2f2f2;padding: 18px 32px;}'
+    '#node-article-wrap .node-container {width: 100%;}'
+    '#node-article-wrap .node-container .title {margin: 0;font-size: 20px;color: var(--main-color);font-weight: 600;line-height: 28px;overflow: hidden;text-overflow: ellipsis;display:-webkit-box;-webkit-line-clamp:2;-webkit-box-orient: vertical;}'
+    '#node-article-wrap .node-container .info {margin: 0;display: flex;justify-content: flex-start;align-items: center;font-size: 14px;color: var(--secondary-color);line-height: 20px;}'
+    '#node-article-wrap .node-container .info .avatar {margin: 0;width: 20px !important;height: 20px;border-radius: 50%;}'
+    '#node-article-wrap .node-container .info .media-name {margin-left: 8px;}'
+    '#node-article-wrap .node-container .info .date {margin-left: 2px;}'
+    '#node-article-wrap .node-container .thumbnail {margin-top: 16px;width: 100%;border-radius: 8px;}'
+    '#node-article-wrap.selected {border: 2px solid rgba(36, 81, 255, 0.6);}'
+    '.embedcard-twitter {position: relative;display: flex;justify-content: center;align-items: center;flex-direction: column;width: 100%;height: 100%;margin: 0 !important;}'
+    '.embedcard-twitter .loading {position: absolute;left: 50%;top: 50%;transform: translate(-50%, -50%);z-index: 9;}'
+    '.embedcard-twitter .embed-holder {position: relative;width: 100%;margin: 0 !important;}'
+    '.embedcard-twitter .embed-holder .twitter-tweet {margin: 0 !important;}'
+    '.embedcard-youtube {position: relative;display: flex;justify-content: center;align-items: center;flex-direction: column;width: 100%;height: 100%;margin: 0 !important;}'
+    '.embedcard-youtube .loading {position: absolute;left: 50%;top: 50%;transform: translate(-50%, -50%);z-index: 9;}'
+    '.embedcard-youtube .embed-holder {position: relative;width: 100%;height: 0;padding-bottom: 56.25%;margin: 0 !important;}'
+    '.embedcard-youtube .embed-holder .iframe {position: absolute;left: 0;top: 0;width: 100%;height: 100%;}'
+    '.embedcard-instagram {position: relative;display: flex;justify-content: center;align-items: center;flex-direction: column;width: 100%;height: 100%;margin: 0 !important;}'
+    '.embedcard-instagram .loading {position: absolute;left: 50%;top: 50%;transform: translate(-50%, -50%);z-index: 9;}'
+    '.embedcard-instagram .embed-holder {position: relative;width: 100%;margin: 0 !important;}'
+    '.embedcard-instagram .embed-holder iframe {margin: 0 !important;}'
+    '.embedcard-facebook {position: relative;display: flex;justify-content: center;align-items: center;flex-direction: column;width: 100%;height: 100%;margin: 0 !important;}'
+    '.embedcard-facebook .loading {position: absolute;left: 50%;top: 50%;transform: translate(-50%, -50%);z-index: 9;}'
+    '.embedcard-facebook .embed-holder {position: relative;width: 100%;margin: 0 !important;}'
+    '.embedcard-facebook .embed-holder iframe {margin: 0 !important;}'
+    '</style>'
+)
+
+# Trailing empty paragraph appended on publish.
+EMPTY_PARAGRAPH = '<p class="NBAIEditor_Theme__paragraph"><br></p>'
@@ -1,9 +1,12 @@
 import uuid
-import requests
-from requests_toolbelt.multipart.encoder import MultipartEncoder
-from config import get_common_headers, get_api_base_url
+import secrets
+import mmap
+from requests_toolbelt.multipart.encoder import MultipartEncoder, FileWrapper
+from config import get_common_headers, get_api_base_url, get_session
 import os
 
+_UPLOAD_URL = f"{get_api_base_url()}/storage/uploadFile"
+
 def upload_image(image_path, data_id, cookies):
     """
     Upload an image to the NewsBreak backend.
@@ -16,31 +19,36 @@ def upload_image(image_path, data_id, cookies):
     Returns:
         tuple: (status_code, response_text, request_id)
     """
-    url = f"{get_api_base_url()}/storage/uploadFile"
-
     # Generate unique IDs for tracking
-    unique_request_id = str(uuid.uuid4())
-    trace_id = str(uuid.uuid4())
+    unique_request_id = uuid.uuid4().hex
+    trace_id = secrets.token_hex(16)
 
     # Use the static boundary from the cURL example.
     boundary = "----WebKitFormBoundaryNGAmcUQFcSTXnpe4"
 
-    # Build the multipart payload with a custom boundary.
+    # Build the multipart payload with a custom boundary. Memory-map the file
+    # so it streams from the page cache instead of being read fully into RAM.
     with open(image_path, "rb") as f:
-        multipart_data = MultipartEncoder(
-            fields={
-                "file": ("blob", f, "image/jpeg")
-            },
-            boundary=boundary
-        )
-
-        # Get common headers from config
-        headers = get_common_headers(request_id=unique_request_id, trace_id=trace_id)
-        # Override Content-Type for multipart data and update referer
-        headers["Content-Type"] = multipart_data.content_type
-        headers["Referer"] = f"{os.getenv('REFERER_BASE')}/new-editor/{data_id}"
-
-        # Send the POST request with our custom multipart payload.
-        response = requests.post(url, headers=headers, cookies=cookies, data=multipart_data)
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            # FileWrapper reports remaining (not total) length, which the
+            # encoder needs to know when the mmap is drained.
+            multipart_data = MultipartEncoder(
+                fields={
+                    "file": ("blob", FileWrapper(mm), "image/jpeg")
+                },
+                boundary=boundary
+            )
+
+            # Get common headers from config
+            headers = get_common_headers(request_id=unique_request_id, trace_id=trace_id)
+            # Override Content-Type for multipart data and update referer
+            headers["Content-Type"] = multipart_data.content_type
+            headers["Referer"] = f"{os.getenv('REFERER_BASE')}/new-editor/{data_id}"
+
+            # Send the POST request with our custom multipart payload.
+            response = get_session().post(_UPLOAD_URL, headers=headers, cookies=cookies, data=multipart_data)
+        finally:
+            mm.close()
 
     return response.status_code, response.text, unique_request_id
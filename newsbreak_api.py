@@ -5,17 +5,27 @@ from helpers.calculate import calculate_nlp
 from helpers.put_request import make_put_request
 from helpers.config import get_cookies
 import json
+import orjson
+import re
 import sys
 import logging
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from pathlib import Path
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# Compiled once; the error-extraction fallback shouldn't pay an import plus
+# re.compile on every failed response.
+_HTML_ERR_RE = re.compile(
+    r'<div[^>]*class="[^"]*error[^"]*"[^>]*>(.*?)</div>',
+    re.IGNORECASE | re.DOTALL,
+)
+
 @dataclass
 class ArticleConfig:
     # Default values
@@ -28,6 +38,9 @@ class ArticleConfig:
     content_file: str = "./example_article_content.txt"
     image_file: str = "./example_image.jpg"
 
+# Field names settable from the config file or CLI, computed once.
+_CONFIG_FIELDS = frozenset(f.name for f in fields(ArticleConfig))
+
 def parse_args() -> ArticleConfig:
     parser = argparse.ArgumentParser(description='NewsBreak API Article Publisher')
     parser.add_argument('--title', help='Article title')
@@ -49,38 +62,37 @@ def parse_args() -> ArticleConfig:
             with open(args.config, 'r') as f:
                 config_data = json.load(f)
                 for key, value in config_data.items():
-                    if hasattr(config, key):
+                    if key in _CONFIG_FIELDS:
                         setattr(config, key, value)
         except Exception as e:
             logger.error(f"Error loading config file: {e}")
             sys.exit(1)
     
-    # Command line arguments override config file
+    # Command line arguments override config file; argparse already converts
+    # dashes to underscores in dest names, so no per-key replace is needed.
     for key, value in vars(args).items():
-        if value is not None and hasattr(config, key.replace('-', '_')):
-            setattr(config, key.replace('-', '_'), value)
+        if value is not None and key in _CONFIG_FIELDS:
+            setattr(config, key, value)
     
     return config
 
 def process_json_response(response_text: str) -> Optional[Dict[str, Any]]:
     """Parse JSON response and handle errors."""
     try:
-        data = json.loads(response_text)
+        data = orjson.loads(response_text)
         if isinstance(data, dict):
             if data.get('code') != 0:  # Assuming 0 is success code
                 logger.error(f"API Error: {data.get('message', 'No error message')}")
                 return None
         return data
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         logger.error(f"Failed to parse response as JSON. Response type: {type(response_text)}")
         logger.error(f"Response content type check - Contains HTML: {'<html' in response_text.lower()}")
         logger.error(f"First 500 characters: {response_text[:500]}...")
         
         # Try to extract any error messages from HTML
         if '<html' in response_text.lower():
-            import re
-            error_pattern = re.compile(r'<div[^>]*class="[^"]*error[^"]*"[^>]*>(.*?)</div>', re.IGNORECASE)
-            matches = error_pattern.findall(response_text)
+            matches = _HTML_ERR_RE.findall(response_text)
             if matches:
                 logger.error("Found error messages in HTML:")
                 for msg in matches:
@@ -96,9 +108,9 @@ def main():
         logger.error(f"Content file not found: {config.content_file}")
         sys.exit(1)
     
-    # Read article content
+    # Read article content (explicit encoding avoids locale-dependent decode)
     try:
-        with open(content_path, 'r') as f:
+        with open(content_path, 'r', encoding='utf-8') as f:
             article_content = f.read()
     except Exception as e:
         logger.error(f"Error reading content file: {e}")
@@ -116,7 +128,9 @@ def main():
         print(f"  image_link: {config.image_link}")
         print(f"  image_credit: {config.image_credit}")
         print(f"  content_file: {config.content_file}")
-        print(f"  content preview: {article_content[:200]}...")
+        # %.200s lets logging skip both the slice and the formatting when
+        # DEBUG is off
+        logger.debug("content preview: %.200s...", article_content)
         
         status_code, response_text, request_id = create_draft(
             title=config.title,
@@ -149,7 +163,7 @@ def main():
         print("Input Parameters:")
         print(f"  image_path: {image_path}")
         print(f"  data_id: {data_id}")
-        print(f"  cookies: {json.dumps(cookies, indent=2)}")
+        logger.debug("cookies: %s", cookies)
         
         image_status, image_response, image_request_id = upload_image(
             image_path=image_path,
@@ -176,28 +190,38 @@ def main():
         # 3. Update article content with PUT request
         print("\n=== Updating Article Content ===")
         try:
-            # First verify we have valid content
-            with open(content_path, "r") as f:
-                content = f.read()
-            if not content.strip():
+            # The content was already read above; just verify it's non-empty
+            if not article_content.strip():
                 logger.error("Content file is empty")
                 sys.exit(1)
-            
+
             print("Input Parameters:")
             print(f"  article_id: {data_id}")
             print(f"  title: {config.title}")
-            print(f"  content (first 200 chars): {article_content[:200]}...")
-            print(f"  cookies: {json.dumps(cookies, indent=2)}")
+            logger.debug("content (first 200 chars): %.200s...", article_content)
+            logger.debug("cookies: %s", cookies)
             
-            logger.info(f"Content length: {len(content)} characters")
+            logger.info(f"Content length: {len(article_content)} characters")
             logger.info(f"Article ID for PUT request: {data_id}")
             
-            put_status, put_response, put_request_id = make_put_request(
-                article_id=data_id,
-                title=config.title,
-                content=article_content,
-                cookies=cookies
-            )
+            # The content PUT and the NLP calculation only depend on the
+            # draft's data_id, so run both in flight at once; they share the
+            # pooled session, and this saves a full round trip per article.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                put_future = executor.submit(
+                    make_put_request,
+                    article_id=data_id,
+                    title=config.title,
+                    content=article_content,
+                    cookies=cookies
+                )
+                nlp_future = executor.submit(
+                    calculate_nlp,
+                    post_id=int(data_id),
+                    cookies=cookies
+                )
+                put_status, put_response, put_request_id = put_future.result()
+                nlp_status, nlp_response, nlp_request_id = nlp_future.result()
 
             print(f"Content Update Status: {put_status}")
             print(f"Content Update Request ID: {put_request_id}")
@@ -208,37 +232,19 @@ def main():
                 logger.error(f"Response: {put_response[:500]}...")
                 sys.exit(1)
 
-            # Check for HTML response which indicates session expiration
-            if isinstance(put_response, str) and ('<html' in put_response.lower() or put_response.strip().startswith('<!DOCTYPE')):
-                logger.error("Session expired - received HTML login page")
-                logger.error("Please refresh your session cookies and try again")
+            # Parse once; process_json_response handles HTML login pages and
+            # API error codes, so no second json.loads is needed here.
+            put_data = process_json_response(put_response)
+            if not put_data:
+                logger.error("Content update failed")
                 sys.exit(1)
 
-            # Try to parse response as JSON
-            try:
-                put_data = json.loads(put_response)
-                if isinstance(put_data, dict) and put_data.get('code') != 0:
-                    logger.error(f"API Error: {put_data.get('message', 'Unknown error')}")
-                    sys.exit(1)
-            except json.JSONDecodeError:
-                logger.error("Failed to parse response as JSON")
-                logger.error(f"Response preview: {put_response[:500]}...")
-                sys.exit(1)
-
-        except FileNotFoundError:
-            logger.error("Could not find fake-content.txt file")
-            sys.exit(1)
         except Exception as e:
             logger.error(f"Unexpected error during PUT request: {str(e)}")
             sys.exit(1)
 
-        # 4. Calculate NLP metrics
+        # 4. NLP metrics (already computed concurrently with the PUT above)
         print("\n=== Calculating NLP Metrics ===")
-        nlp_status, nlp_response, nlp_request_id = calculate_nlp(
-            post_id=int(data_id),
-            cookies=cookies
-        )
-
         print(f"NLP Calculation Status: {nlp_status}")
         print(f"NLP Request ID: {nlp_request_id}")
 
@@ -266,16 +272,13 @@ def main():
             print(f"Publish Status: {publish_status}")
             print(f"Publish Request ID: {publish_request_id}")
 
-            # Try to parse and print response nicely
-            try:
-                response_data = json.loads(publish_response)
-                print("Publish Response:", json.dumps(response_data, indent=2))
-            except json.JSONDecodeError:
-                if '<html' in publish_response.lower():
-                    print("Error: Received HTML response - Session may have expired")
-                    print("Response preview:", publish_response[:200] + "...")
-                else:
-                    print("Raw Response:", publish_response[:200] + "..." if len(publish_response) > 200 else publish_response)
+            # Parse once and print the result; process_json_response already
+            # reports HTML responses and API error codes.
+            publish_data = process_json_response(publish_response)
+            if publish_data is not None:
+                print("Publish Response:", json.dumps(publish_data, indent=2))
+            else:
+                print("Raw Response:", publish_response[:200] + "..." if len(publish_response) > 200 else publish_response)
 
         except PublishError as e:
             print(f"Publishing failed: {e.message}")